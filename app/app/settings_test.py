@@ -0,0 +1,11 @@
+"""
+Django settings for running the app test suite.
+
+Password hashing is swapped for a fast (and insecure) hasher, since the
+tests create users in almost every setup step.
+"""
+from app.settings import *  # noqa: F401,F403
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
@@ -7,6 +7,9 @@ from django.contrib.auth import get_user_model
 from core import models
 
 
+PRICE_5_50 = Decimal('5.50')
+
+
 def sample_user(email='test@test.com', password='testpass'):
     """Create a sample user."""
     return get_user_model().objects.create_user(email, password)
@@ -36,11 +39,9 @@ class ModelTests(TestCase):
         ]
 
         for email, expected in emails:
-            user = get_user_model().objects.create_user(
-                email=email,
-                password='Testpass123',
-            )
-            self.assertEqual(user.email, expected)
+            with self.subTest(email=email):
+                user = get_user_model().objects.create_user(email=email)
+                self.assertEqual(user.email, expected)
 
     def test_new_user_invalid_email(self):
         """Test creating user with no email raises error."""
@@ -69,7 +70,7 @@ class ModelTests(TestCase):
             user=user,
             title='Steak and mushroom sauce',
             time_minutes=5,
-            price=Decimal('5.50'),
+            price=PRICE_5_50,
             description='How to make the best steak and mushroom sauce',
         )
 
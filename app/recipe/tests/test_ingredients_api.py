@@ -2,7 +2,7 @@ from decimal import Decimal
 
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -28,7 +28,7 @@ def create_user(email='test@test.com', password='password123'):
     return get_user_model().objects.create_user(email, password)
 
 
-class PublicIngredientsApiTests(TestCase):
+class PublicIngredientsApiTests(SimpleTestCase):
     """Test the publicly available ingredients API."""
 
     def setUp(self):
@@ -6,7 +6,7 @@
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 
 from rest_framework import status
@@ -24,12 +24,21 @@ from recipe.serializers import (
 )
 
 
+PRICE_4_50 = Decimal('4.50')
+PRICE_5_25 = Decimal('5.25')
+PRICE_7_50 = Decimal('7.50')
+PRICE_20_00 = Decimal('20.00')
+
 RECIPES_URL = reverse('recipe:recipe-list')
+RECIPE_DETAIL_URL_PARTS = reverse(
+    'recipe:recipe-detail', args=[0]
+).rsplit('0', 1)
 
 
 def detail_url(recipe_id):
     """Return recipe detail URL."""
-    return reverse('recipe:recipe-detail', args=[recipe_id])
+    prefix, suffix = RECIPE_DETAIL_URL_PARTS
+    return f'{prefix}{recipe_id}{suffix}'
 
 
 def image_upload_url(recipe_id):
@@ -37,18 +46,33 @@ def image_upload_url(recipe_id):
     return reverse('recipe:recipe-upload-image', args=[recipe_id])
 
 
-def sample_recipe(user, **params):
-    """Create and return a sample recipe."""
+def _recipe_defaults(**params):
+    """Return sample recipe fields updated with params."""
     defaults = {
         'title': 'Sample recipe',
         'time_minutes': 10,
-        'price': Decimal('5.25'),
+        'price': PRICE_5_25,
         'description': 'Sample recipe description',
         'link': 'http://www.sample.com',
     }
     defaults.update(params)
 
-    return Recipe.objects.create(user=user, **defaults)
+    return defaults
+
+
+def sample_recipe(user, **params):
+    """Create and return a sample recipe."""
+    return Recipe.objects.create(user=user, **_recipe_defaults(**params))
+
+
+def sample_recipes(user, n, **params):
+    """Create and return n sample recipes in a single query."""
+    defaults = _recipe_defaults(**params)
+
+    return Recipe.objects.bulk_create(
+        [Recipe(user=user, **defaults) for _ in range(n)],
+        batch_size=100,
+    )
 
 
 def create_user(**params):
@@ -56,7 +80,7 @@ def create_user(**params):
     return get_user_model().objects.create_user(**params)
 
 
-class PublicRecipeApiTests(TestCase):
+class PublicRecipeApiTests(SimpleTestCase):
     """Test unauthenticated recipe API access."""
 
     def setUp(self):
@@ -72,20 +96,35 @@ class PublicRecipeApiTests(TestCase):
 class PrivateRecipeApiTests(TestCase):
     """Test authenticated recipe API access."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='testuser@example.',
             password='testpass',
         )
-        self.client.force_authenticate(self.user)
+        cls.tag_indian = Tag.objects.create(user=cls.user, name='Indian')
+        cls.ingredient_ginger = Ingredient.objects.create(
+            user=cls.user, name='Ginger'
+        )
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Not deep-copied per test, so its user is cls.user, not self.user.
+        cls.authenticated_client = APIClient()
+        cls.authenticated_client.force_authenticate(cls.user)
+
+    def setUp(self):
+        self.client = self.authenticated_client
 
     def test_retrieve_recipes(self):
         """Test retrieving a list of recipes."""
-        sample_recipe(user=self.user)
-        sample_recipe(user=self.user)
+        sample_recipes(user=self.user, n=2)
 
-        res = self.client.get(RECIPES_URL)
+        # One query for the recipes plus one per prefetched relation,
+        # regardless of how many recipes are listed.
+        with self.assertNumQueries(3):
+            res = self.client.get(RECIPES_URL)
 
         recipes = Recipe.objects.all().order_by('-id')
         serializer = RecipeSerializer(recipes, many=True)
@@ -123,7 +162,7 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             'title': 'Chocolate cheesecake',
             'time_minutes': 30,
-            'price': Decimal('5.25'),
+            'price': PRICE_5_25,
         }
         res = self.client.post(RECIPES_URL, payload)
 
@@ -161,7 +200,7 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             'title': 'New title',
             'time_minutes': 30,
-            'price': Decimal('5.25'),
+            'price': PRICE_5_25,
         }
         url = detail_url(recipe.id)
         res = self.client.put(url, payload)
@@ -209,7 +248,7 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             'title': 'Avocado lime cheesecake',
             'time_minutes': 60,
-            'price': Decimal('20.00'),
+            'price': PRICE_20_00,
             'tags': [{'name': 'Vegan'}, {'name': 'Dessert'}]
         }
         res = self.client.post(RECIPES_URL, payload, format='json')
@@ -219,18 +258,16 @@ class PrivateRecipeApiTests(TestCase):
         self.assertEqual(recipes.count(), 1)
         recipe = recipes[0]
         self.assertEqual(recipe.tags.count(), 2)
-        tags = recipe.tags.all()
-        self.assertEqual(tags.count(), 2)
+        tag_names = set(recipe.tags.values_list('name', flat=True))
         for tag in payload['tags']:
-            self.assertIn(tag['name'], [t.name for t in tags])
+            self.assertIn(tag['name'], tag_names)
 
     def test_create_recipe_with_existing_tags(self):
         """Test creating a recipe with existing tags."""
-        tag_indian = Tag.objects.create(user=self.user, name='Indian')
         payload = {
             'title': 'Pongal',
             'time_minutes': 60,
-            'price': Decimal('4.50'),
+            'price': PRICE_4_50,
             'tags': [{'name': 'Indian'}, {'name': 'Breakfast'}],
         }
 
@@ -241,21 +278,22 @@ class PrivateRecipeApiTests(TestCase):
         self.assertEqual(recipes.count(), 1)
         recipe = recipes[0]
         self.assertEqual(recipe.tags.count(), 2)
-        self.assertIn(tag_indian, recipe.tags.all())
+        self.assertIn(self.tag_indian, recipe.tags.all())
+        tag_names = set(recipe.tags.values_list('name', flat=True))
         for tag in payload['tags']:
-            self.assertIn(tag['name'], [t.name for t in recipe.tags.all()])
+            self.assertIn(tag['name'], tag_names)
 
     def test_create_tag_on_update(self):
         """Test creating a tag on update."""
         recipe = sample_recipe(user=self.user)
         payload = {
-            'tags': [{'name': 'Indian'}],
+            'tags': [{'name': 'Thai'}],
         }
         url = detail_url(recipe.id)
         res = self.client.patch(url, payload, format='json')
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        tag = Tag.objects.get(user=self.user, name='Indian')
+        tag = Tag.objects.get(user=self.user, name='Thai')
         self.assertIn(tag, recipe.tags.all())
 
     def test_update_recipe_assign_tag(self):
@@ -291,10 +329,10 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             'title': 'Thai prawn red curry',
             'time_minutes': 20,
-            'price': Decimal('7.50'),
+            'price': PRICE_7_50,
             'ingredients': [
                 {'name': 'Prawns'},
-                {'name': 'Ginger'}
+                {'name': 'Lemongrass'}
             ]
         }
         res = self.client.post(RECIPES_URL, payload, format='json')
@@ -304,19 +342,18 @@ class PrivateRecipeApiTests(TestCase):
         self.assertEqual(recipe.count(), 1)
         recipe = recipe[0]
         self.assertEqual(recipe.ingredients.count(), 2)
+        ingredient_names = set(
+            recipe.ingredients.values_list('name', flat=True)
+        )
         for ingredient in payload['ingredients']:
-            self.assertIn(ingredient['name'],
-                          [i.name for i in recipe.ingredients.all()])
+            self.assertIn(ingredient['name'], ingredient_names)
 
     def test_create_recipe_with_existing_ingredients(self):
         """Test creating a recipe with existing ingredients."""
-        ingredient_ginger = Ingredient.objects.create(
-            user=self.user, name='Ginger'
-        )
         payload = {
             'title': 'Thai prawn red curry',
             'time_minutes': 20,
-            'price': Decimal('7.50'),
+            'price': PRICE_7_50,
             'ingredients': [
                 {'name': 'Prawns'},
                 {'name': 'Ginger'}
@@ -329,30 +366,32 @@ class PrivateRecipeApiTests(TestCase):
         self.assertEqual(recipe.count(), 1)
         recipe = recipe[0]
         self.assertEqual(recipe.ingredients.count(), 2)
-        self.assertIn(ingredient_ginger, recipe.ingredients.all())
+        self.assertIn(self.ingredient_ginger, recipe.ingredients.all())
+        ingredient_names = set(
+            recipe.ingredients.values_list('name', flat=True)
+        )
         for ingredient in payload['ingredients']:
-            self.assertIn(ingredient['name'],
-                          [i.name for i in recipe.ingredients.all()])
+            self.assertIn(ingredient['name'], ingredient_names)
 
     def test_create_ingredient_on_update(self):
         """Test creating an ingredient on update."""
         recipe = sample_recipe(user=self.user)
         payload = {
-            'ingredients': [{'name': 'Ginger'}],
+            'ingredients': [{'name': 'Lemongrass'}],
         }
         url = detail_url(recipe.id)
         res = self.client.patch(url, payload, format='json')
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        ingredient = Ingredient.objects.get(user=self.user, name='Ginger')
+        ingredient = Ingredient.objects.get(
+            user=self.user, name='Lemongrass'
+        )
         self.assertIn(ingredient, recipe.ingredients.all())
 
     def test_update_recipe_assign_ingredient(self):
         """Test updating a recipe to assign an ingredient."""
-        ingredient_ginger = Ingredient.objects.create(user=self.user,
-                                                      name='Ginger')
         recipe = sample_recipe(user=self.user)
-        recipe.ingredients.add(ingredient_ginger)
+        recipe.ingredients.add(self.ingredient_ginger)
 
         ingredient_prawns = Ingredient.objects.create(user=self.user,
                                                       name='Prawns')
@@ -362,14 +401,12 @@ class PrivateRecipeApiTests(TestCase):
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertIn(ingredient_prawns, recipe.ingredients.all())
-        self.assertNotIn(ingredient_ginger, recipe.ingredients.all())
+        self.assertNotIn(self.ingredient_ginger, recipe.ingredients.all())
 
     def test_clear_recipe_ingredients(self):
         """Test clearing ingredients from a recipe."""
-        ingredient_ginger = Ingredient.objects.create(user=self.user,
-                                                      name='Ginger')
         recipe = sample_recipe(user=self.user)
-        recipe.ingredients.add(ingredient_ginger)
+        recipe.ingredients.add(self.ingredient_ginger)
 
         payload = {'ingredients': []}
         url = detail_url(recipe.id)
@@ -2,7 +2,7 @@ from decimal import Decimal
 
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -33,7 +33,7 @@ def sample_tag(user, name='Main course'):
     return Tag.objects.create(user=user, name=name)
 
 
-class PublicTagsApiTests(TestCase):
+class PublicTagsApiTests(SimpleTestCase):
     """Test the publicly available tags API."""
 
     def setUp(self):
@@ -49,15 +49,25 @@ class PublicTagsApiTests(TestCase):
 class PrivateTagsApiTests(TestCase):
     """Test the authorized user tags API."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.authenticated_client = APIClient()
+        cls.authenticated_client.force_authenticate(cls.user)
+
     def setUp(self):
-        self.user = create_user()
-        self.client = APIClient()
-        self.client.force_authenticate(self.user)
+        self.client = self.authenticated_client
 
     def test_retrieve_tags(self):
         """Test retrieving tags."""
-        sample_tag(user=self.user)
-        sample_tag(user=self.user, name='Dessert')
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name='Main course'),
+            Tag(user=self.user, name='Dessert'),
+        ])
 
         res = self.client.get(TAGS_URL)
 
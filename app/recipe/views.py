@@ -54,7 +54,9 @@ class RecipeViewSet(viewsets.ModelViewSet):
         tags = self.request.query_params.get('tags')
         ingredients = self.request.query_params.get('ingredients')
         queryset = self.queryset
-        queryset = queryset.filter(user=self.request.user)
+        queryset = queryset.filter(
+            user=self.request.user
+        ).prefetch_related('tags', 'ingredients')
 
         if tags:
             tag_ids = self._params_to_ints(tags)